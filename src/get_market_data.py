@@ -6,18 +6,19 @@ Features:
 - Reads inventory from Excel file
 - Fetches current market data using scraper.py
 - Filters for items from Deutschland and in "Brandneu" condition
-- Saves individual CSV files for each set
+- Saves individual CSV (or Parquet/Feather) files for each set
 - Creates a manifest file listing all generated CSVs
 """
 
 import os
-import sys
+import argparse
+import logging
 from datetime import datetime
 import json
-from scraper import EbayScraper
+from scraper import EbayScraper, RESULT_FORMATS
 
 class MarketDataCollector:
-    def __init__(self):
+    def __init__(self, use_cache=True, polite=False, workers=4, output_format='csv', combined=False):
         """Initialize the Market Data Collector."""
         self.base_dir = os.getcwd()
         self.data_dir = os.path.join(self.base_dir, 'data')
@@ -30,7 +31,10 @@ class MarketDataCollector:
         
         # Initialize scraper
         print("Scraper initialized")
-        self.scraper = EbayScraper()
+        self.scraper = EbayScraper(use_cache=use_cache, polite=polite, output_format=output_format,
+                                   per_set_files=not combined)
+        self.workers = workers
+        self.combined = combined
         print("Market Data Collector initialized\n")
 
     def read_inventory(self):
@@ -60,13 +64,24 @@ class MarketDataCollector:
             print(f"Error reading inventory: {e}")
             return None
 
-    def fetch_and_save_set_data(self, set_number):
-        """Fetch and save market data for a specific set."""
+    def fetch_and_save_all(self, set_numbers):
+        """Fetch market data for several sets in parallel and return the data files."""
+        print(f"\nFetching data for {len(set_numbers)} sets")
+        all_data = self.scraper.fetch_many(set_numbers, max_workers=self.workers)
+        if self.combined:
+            combined_file = self.scraper.save_combined_results(all_data)
+            return [combined_file] if combined_file else []
+        
+        data_files = []
+        for set_number, ebay_data in all_data.items():
+            csv_path = self.process_set_data(set_number, ebay_data)
+            if csv_path:
+                data_files.append(csv_path)
+        return data_files
+
+    def process_set_data(self, set_number, ebay_data):
+        """Check the fetched market data of a set and return its data file."""
         try:
-            print(f"\nFetching data for set {set_number}")
-            
-            # Get market data
-            ebay_data = self.scraper.fetch_ebay_sold_items(set_number)
             if ebay_data is None or ebay_data.empty:
                 print(f"No market data found for set {set_number}")
                 return None
@@ -81,15 +96,16 @@ class MarketDataCollector:
                 print(f"No valid items found for set {set_number} after filtering")
                 return None
             
-            # Find the CSV file created by the scraper
-            csv_files = [f for f in os.listdir(self.data_dir) 
-                        if f.startswith(f'Ebay_Lego_{set_number}_') and f.endswith('.csv')]
-            if not csv_files:
-                print(f"No CSV file found for set {set_number}")
+            # Find the data file created by the scraper
+            extensions = tuple(f'.{fmt}' for fmt in RESULT_FORMATS)
+            data_files = [f for f in os.listdir(self.data_dir) 
+                         if f.startswith(f'Ebay_Lego_{set_number}_') and f.endswith(extensions)]
+            if not data_files:
+                print(f"No data file found for set {set_number}")
                 return None
                 
             # Get the latest file
-            latest_file = max(csv_files)
+            latest_file = max(data_files, key=lambda f: os.path.getmtime(os.path.join(self.data_dir, f)))
             filepath = os.path.join(self.data_dir, latest_file)
             print(f"Using data file: {latest_file}")
             
@@ -124,14 +140,39 @@ class MarketDataCollector:
             print(f"Error creating manifest: {e}")
             return None
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Collect eBay market data for LEGO sets.")
+    parser.add_argument('set_numbers', nargs='*',
+                        help="LEGO set numbers to process (default: all sets in the inventory)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore cached result pages and fetch everything again")
+    parser.add_argument('--polite', action='store_true',
+                        help="wait a short random time before each request to eBay")
+    parser.add_argument('--verbose', action='store_true',
+                        help="log details for every scraped item")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="number of sets scraped in parallel, one browser each (default: 4)")
+    parser.add_argument('--format', choices=RESULT_FORMATS, default='csv',
+                        help="file format of the saved results (default: csv)")
+    parser.add_argument('--combined', action='store_true',
+                        help="save all sets to one file instead of one file per set")
+    return parser.parse_args()
+
 def main():
     """Main function to run the market data collection."""
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if args.verbose:
+        logging.getLogger(EbayScraper.__module__).setLevel(logging.DEBUG)
     print("Starting LEGO Market Data Collection...")
-    collector = MarketDataCollector()
+    collector = MarketDataCollector(use_cache=not args.no_cache, polite=args.polite,
+                                    workers=args.workers, output_format=args.format,
+                                    combined=args.combined)
     
     # Check if specific set numbers were provided as command line arguments
-    if len(sys.argv) > 1:
-        set_numbers = sys.argv[1:]
+    if args.set_numbers:
+        set_numbers = args.set_numbers
         print(f"Processing specified sets: {', '.join(set_numbers)}\n")
     else:
         # If no arguments provided, read all sets from inventory
@@ -140,12 +181,8 @@ def main():
             print("No sets to process. Please check your inventory file or provide set numbers as arguments.")
             return
     
-    # Process each set
-    data_files = []
-    for set_number in set_numbers:
-        csv_path = collector.fetch_and_save_set_data(set_number)
-        if csv_path:
-            data_files.append(csv_path)
+    # Process all sets
+    data_files = collector.fetch_and_save_all(set_numbers)
     
     # Create manifest file
     collector.create_manifest(data_files)
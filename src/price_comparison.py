@@ -11,6 +11,13 @@ import glob
 from datetime import datetime
 import re
 
+# Readers for the file formats the scraper can save market data in
+MARKET_DATA_READERS = {
+    '.csv': pd.read_csv,
+    '.parquet': pd.read_parquet,
+    '.feather': pd.read_feather,
+}
+
 class PriceAnalyzer:
     def __init__(self):
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -69,12 +76,25 @@ class PriceAnalyzer:
 
     def find_latest_market_data(self, set_number):
         """Find the latest market data file for a given set number."""
-        pattern = os.path.join(self.data_dir, f'Ebay_Lego_{set_number}_*.csv')
-        files = glob.glob(pattern)
+        files = []
+        for extension in MARKET_DATA_READERS:
+            pattern = os.path.join(self.data_dir, f'Ebay_Lego_{set_number}_*{extension}')
+            files.extend(glob.glob(pattern))
         if not files:
             return None
         return max(files, key=os.path.getctime)
 
+    def load_combined_market_data(self, filepath):
+        """Load a combined market data file (all sets of one run)."""
+        market_data = self.read_market_data(filepath)
+        market_data['Set Number'] = market_data['Set Number'].astype(str)
+        return market_data
+
+    def read_market_data(self, filepath):
+        """Read a market data file saved by the scraper in any of its output formats."""
+        extension = os.path.splitext(filepath)[1]
+        return MARKET_DATA_READERS[extension](filepath)
+
     def calculate_statistics(self, market_data):
         """Calculate market statistics from the data."""
         if market_data.empty:
@@ -98,17 +118,30 @@ class PriceAnalyzer:
 
         results = []
         sets_without_data = []
+        # Used for sets whose own market data file is missing or older
+        combined_file = self.find_latest_market_data('combined')
+        combined_data = self.load_combined_market_data(combined_file) if combined_file else None
 
         for _, row in inventory_data.iterrows():
             set_number = row['Set']
             market_data_file = self.find_latest_market_data(set_number)
             
-            if market_data_file is None:
+            if market_data_file is None and combined_data is None:
                 sets_without_data.append(set_number)
                 continue
 
             try:
-                market_data = pd.read_csv(market_data_file)
+                # Use the newer of the set's own file and the combined file, unless
+                # the combined file has no rows for this set
+                market_data = None
+                if combined_data is not None and (
+                        market_data_file is None
+                        or os.path.getctime(combined_file) > os.path.getctime(market_data_file)):
+                    market_data = combined_data[combined_data['Set Number'] == set_number]
+                    if market_data.empty and market_data_file is not None:
+                        market_data = None
+                if market_data is None:
+                    market_data = self.read_market_data(market_data_file)
                 stats = self.calculate_statistics(market_data)
                 
                 if stats is None:
@@ -170,9 +203,10 @@ class PriceAnalyzer:
         ]
         results_df = results_df[column_order]
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        start_date = (datetime.now() - pd.Timedelta(days=30)).strftime('%Y%m%d')
-        end_date = datetime.now().strftime('%Y%m%d')
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        start_date = (now - pd.Timedelta(days=30)).strftime('%Y%m%d')
+        end_date = now.strftime('%Y%m%d')
         filename = f'Price_Comparison_Results_{start_date}_{end_date}_{timestamp}.csv'
         filepath = os.path.join(self.data_dir, filename)
         
@@ -1,7 +1,7 @@
 """
 eBay LEGO Price Scraper
 
-This script fetches sold LEGO set prices from eBay Germany (ebay.de) using Selenium and BeautifulSoup.
+This script fetches sold LEGO set prices from eBay Germany (ebay.de) using Selenium and lxml.
 Features:
 - Searches for specific LEGO set numbers
 - Filters for items sold in Germany only
@@ -9,34 +9,344 @@ Features:
 - Validates set numbers in titles to avoid wrong matches
 - Includes item price, shipping cost, and total price
 - Includes actual sold dates
-- Saves results to CSV file
+- Saves results to CSV (or Parquet/Feather) file
 - Only fetches items sold in the last 30 days
 """
 
 import os
+import csv
+import hashlib
+import logging
+import functools
+import math
+import random
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import re
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from dateutil import parser
 import time
 
 
+logger = logging.getLogger(__name__)
+
+class _DigitRunTable(dict):
+    """
+    str.translate table that keeps digits and turns every other character into a space,
+    so that title.translate(...).split() gives the numbers in a title (same as re.findall(r'\d+')).
+    """
+    def __missing__(self, codepoint):
+        if chr(codepoint).isdecimal():
+            raise LookupError(codepoint)  # leaves the character unchanged
+        self[codepoint] = ' '
+        return ' '
+
+
+# Numbers in item titles
+_DIGIT_RUNS = _DigitRunTable()
+
+# Fallback pattern for price strings that don't parse directly (e.g. price ranges)
+_PRICE_RE = re.compile(r'\d+[.,]?\d*')
+
+# Currency prefixes eBay puts in front of prices
+_CURRENCY_TOKENS = ('EUR', '€', 'US $', '$', 'GBP', '£')
+
+# Currency prefixes of prices that are always written with German separators
+_EURO_TOKENS = ('EUR', '€')
+
+# (tag, class) pairs of the elements we read from each result item
+_ITEM_FIELDS = {
+    ('div', 's-item__title'),
+    ('span', 's-item__price'),
+    ('span', 's-item__shipping'),
+    ('a', 's-item__link'),
+    ('span', 's-item__location'),
+    ('span', 's-item__itemLocation'),
+    ('span', 's-item__endedDate'),
+    ('div', 's-item__ended-date'),
+    ('span', 'POSITIVE'),
+    ('span', 'SECONDARY_INFO'),
+    ('div', 's-item__subtitle'),
+}
+
+# German month names in sold dates and their English equivalents
+_GERMAN_MONTHS = {
+    'Jan': 'Jan', 'Jän': 'Jan', 'Januar': 'January',
+    'Feb': 'Feb', 'Februar': 'February',
+    'Mär': 'Mar', 'Mrz': 'Mar', 'März': 'March',
+    'Apr': 'Apr', 'April': 'April',
+    'Mai': 'May',
+    'Jun': 'Jun', 'Juni': 'June',
+    'Jul': 'Jul', 'Juli': 'July',
+    'Aug': 'Aug', 'August': 'August',
+    'Sep': 'Sep', 'September': 'September',
+    'Okt': 'Oct', 'Oktober': 'October',
+    'Nov': 'Nov', 'November': 'November',
+    'Dez': 'Dec', 'Dezember': 'December'
+}
+
+# Words in sold dates, looked up in _GERMAN_MONTHS to translate month names
+_WORD_RE = re.compile(r'[^\W\d_]+')
+
+# Month numbers of the German month names, for building dates without strptime
+_MONTH_NUMBERS = {name: number for number, name in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), 1)}
+_GERMAN_MONTH_NUMBERS = {german: _MONTH_NUMBERS[english[:3]] for german, english in _GERMAN_MONTHS.items()}
+
+# The usual cleaned sold date, e.g. "12. Mär 2024" or "3. Okt. 2024"
+_GERMAN_DATE_RE = re.compile(r'(\d{1,2})\.?\s+([^\W\d_]+)\.?\s+(\d{4})')
+
+# Numeric sold dates, e.g. "12.03.2024"
+_NUMERIC_DATE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+
+# Formats of the cleaned sold dates, tried before falling back to dateutil
+_DATE_FORMATS = ('%d. %b %Y', '%d. %b. %Y', '%d %b %Y', '%d. %B %Y', '%d %B %Y', '%d-%b-%y')
+
+# Text around the sold date that is removed before parsing it
+_DATE_NOISE_RE = re.compile(r'Verkauft|Beendet:|am')
+
+# Link to the next result page, checked on the raw HTML
+_NEXT_PAGE_RE = re.compile(r'<a\b[^>]*\bclass="[^"]*\bpagination__next\b')
+
+# Result items of a search results page
+_ITEMS_XPATH = etree.XPath("//li[contains(concat(' ', normalize-space(@class), ' '), ' s-item ')]")
+
+# Sold date text of an item without a dedicated date element
+_SOLD_SPAN_XPATH = etree.XPath(".//span[contains(text(), 'Verkauft') or contains(text(), 'Beendet')]")
+_SOLD_DIV_XPATH = etree.XPath(".//div[contains(text(), 'Verkauft') or contains(text(), 'Beendet')]")
+
+# Elements that only ever hold the sold date or the location, in order of preference.
+# span.POSITIVE is only a last resort for the date since sold prices use it too.
+_DATE_FIELDS = (('span', 's-item__endedDate'), ('div', 's-item__ended-date'))
+_LOCATION_FIELDS = (('span', 's-item__location'), ('span', 's-item__itemLocation'))
+
+# Sold-items search results page of a set on ebay.de
+_SEARCH_URL = 'https://www.ebay.de/sch/i.html?_nkw=LEGO+{set_number}&_sop=12&LH_Complete=1&LH_Sold=1&_pgn={page}'
+
+# Lightweight ebay.de URL the browser session is started on, so result pages
+# can be requested same-origin with fetch() instead of being rendered
+_SESSION_URL = 'https://www.ebay.de/robots.txt'
+
+# Requests the browser doesn't need to make for reading result pages
+_BLOCKED_URLS = [
+    '*doubleclick.net*', '*google-analytics.com*', '*googletagmanager.com*',
+    '*googlesyndication.com*', '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp',
+    '*.svg', '*.woff', '*.woff2', '*.mp4',
+]
+
+# Number of result pages fetched concurrently through the browser
+_PAGE_BATCH_SIZE = 4
+
+# A results page with fewer items than this is the last one, whatever its pagination says
+_MIN_FULL_PAGE_ITEMS = 25
+
+# Total number of results in the heading of a results page, e.g. "1.234" in
+# <h1 class="srp-controls__count-heading"><span class="BOLD">1.234</span> Ergebnisse ...
+_RESULT_COUNT_RE = re.compile(r'srp-controls__count-heading\b[^>]*>\s*(?:<span[^>]*>\s*)?([\d.]+)')
+
+# Retries of a page request that failed with one of these statuses or a network
+# error, waiting 1s, 2s, 4s, ... in between. The browser keeps its connections to
+# ebay.de alive, so the retries reuse them.
+_FETCH_RETRIES = 3
+_RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Defines fetchPage(url, attempt), which fetches a page from within the browser
+# page (retrying as described above) and resolves to its HTML, or null if it failed.
+# Fetches started ahead of time are kept in window.__pendingPages until collected.
+_FETCH_PAGE_JS = """
+var urls = arguments[0], retries = arguments[1], retryStatuses = arguments[2];
+var pending = window.__pendingPages = window.__pendingPages || {};
+function fetchPage(url, attempt) {
+    function retry() {
+        if (attempt >= retries) { return null; }
+        return new Promise(function (resolve) { setTimeout(resolve, 1000 * Math.pow(2, attempt)); })
+            .then(function () { return fetchPage(url, attempt + 1); });
+    }
+    return fetch(url, {credentials: 'include'})
+        .then(function (response) {
+            if (response.ok) { return response.text(); }
+            return retryStatuses.indexOf(response.status) >= 0 ? retry() : null;
+        }, retry)
+        .catch(function () { return null; });
+}
+"""
+
+# Starts fetching a list of URLs in the background and returns right away
+_START_FETCH_JS = _FETCH_PAGE_JS + """
+urls.forEach(function (url) { pending[url] = fetchPage(url, 0); });
+"""
+
+# Fetches a list of URLs in parallel (or waits for their background fetches)
+# and returns their HTML (null for failed requests) to Selenium
+_FETCH_PAGES_JS = _FETCH_PAGE_JS + """
+var done = arguments[arguments.length - 1];
+Promise.all(urls.map(function (url) {
+    var page = pending[url] || fetchPage(url, 0);
+    delete pending[url];
+    return page;
+})).then(done);
+"""
+
+# File formats the results can be saved in (parquet and feather need pyarrow)
+RESULT_FORMATS = ('csv', 'parquet', 'feather')
+
+# Column order of the saved results
+_RESULT_COLUMNS = ['Title', 'Item Price', 'Shipping Fee', 'Total Price', 'End Time', 'Condition',
+                  'Seller Type', 'Currency', 'Location', 'URL', 'Set Number']
+
+# Column types of the streamed results, so pandas doesn't have to infer them
+# ('End Time' is converted separately)
+_RESULT_DTYPES = {
+    'Title': str, 'Item Price': 'float64', 'Shipping Fee': 'float64', 'Total Price': 'float64',
+    'Condition': str, 'Seller Type': str, 'Currency': str, 'Location': str, 'URL': str,
+    'Set Number': str,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_price_cached(price_str):
+    """
+    Extract the price value from a price or shipping string, 0.0 if there is none.
+    Cached since many items share prices and shipping texts (e.g. "Kostenloser Versand").
+    """
+    logger.debug("Parsing price: %s", price_str)
+    price_str = price_str.strip()
+    if not price_str:
+        return 0.0
+    # Common case ("EUR 12,34"): strip the currency prefix and convert directly
+    currency = None
+    for token in _CURRENCY_TOKENS:
+        if price_str.startswith(token):
+            currency = token
+            price_str = price_str[len(token):].lstrip()
+            break
+    decimal_comma = ',' in price_str and ('.' not in price_str or price_str.rfind(',') > price_str.rfind('.'))
+    if decimal_comma or currency in _EURO_TOKENS:
+        price_str = price_str.replace('.', '').replace(',', '.')  # German: "1.234,56"
+    else:
+        price_str = price_str.replace(',', '')  # Decimal point: "US $1,234.56", "12.5"
+    try:
+        price = float(price_str)
+    except ValueError:
+        # Fall back to a regex search for anything else, e.g. "EUR 8,00 bis EUR 12,00"
+        match = _PRICE_RE.search(price_str)
+        if not match:
+            logger.debug("Error parsing price: no number found in %r", price_str)
+            return 0.0
+        price = float(match.group())
+    logger.debug("Extracted price: %s", price)
+    return price
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_cached(date_str):
+    """
+    Parse a sold date string to a datetime, or None.
+    Cached since the items on a page share only a few distinct dates.
+    """
+    try:
+        logger.debug("Parsing date: %s", date_str)
+        # Remove common German text and clean up
+        date_str = _DATE_NOISE_RE.sub('', date_str).strip()
+        
+        # Usual format: look the month up and build the date directly
+        match = _GERMAN_DATE_RE.fullmatch(date_str)
+        if match:
+            month = _GERMAN_MONTH_NUMBERS.get(match.group(2))
+            if month is not None:
+                return datetime(int(match.group(3)), month, int(match.group(1)))
+        match = _NUMERIC_DATE_RE.fullmatch(date_str)
+        if match:
+            return datetime(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        
+        # Replace German month names with English ones
+        date_str = _WORD_RE.sub(lambda m: _GERMAN_MONTHS.get(m.group(), m.group()), date_str)
+        
+        logger.debug("Cleaned date string: %s", date_str)
+        for date_format in _DATE_FORMATS:
+            try:
+                date = datetime.strptime(date_str, date_format)
+                break
+            except ValueError:
+                continue
+        else:
+            # Unusual format, let dateutil figure it out
+            date = parser.parse(date_str, fuzzy=True)
+        logger.debug("Parsed date: %s", date)
+        return date
+    except Exception as e:
+        logger.warning("Error parsing date: %s", e)
+        return None
+
+
+def _results_fragment(html):
+    """
+    Return the part of a results page from the result list onwards, so the page
+    header with its large inline scripts doesn't have to be parsed.
+    """
+    start = html.find('srp-results')
+    if start != -1:
+        start = html.rfind('<', 0, start)
+    return html[start:] if start != -1 else html
+
+
+def _estimate_last_page(html, items_on_page):
+    """
+    Estimate the number of result pages from the result count on the first page,
+    or return None if the page doesn't show it. One item of the first page may be
+    a placeholder, so the estimate errs on the high side.
+    """
+    match = _RESULT_COUNT_RE.search(html)
+    if not match or items_on_page < 2:
+        return None
+    try:
+        total = int(match.group(1).replace('.', ''))
+    except ValueError:
+        return None
+    return max(1, math.ceil(total / (items_on_page - 1)))
+
+
+def _format_date(date):
+    """Format a parsed date for the results file."""
+    return date.strftime('%Y-%m-%d') if date else None
+
 
 class EbayScraper:
-    def __init__(self):
+    def __init__(self, use_cache=True, cache_ttl=3600, polite=False, output_format='csv',
+                 per_set_files=True):
         # Setup data directory for saving results, create if it doesn't exist
         self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
         os.makedirs(self.data_dir, exist_ok=True)
         
+        # Setup page cache; use_cache=False still refreshes the cached pages
+        self.cache_dir = os.path.join(self.data_dir, 'cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl  # seconds
+        self._prune_cache()
+        
+        # Add a short random delay before each request to eBay
+        self.polite = polite
+        
+        # File format of the saved results
+        if output_format not in RESULT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.output_format = output_format
+        # Save a file per set; with False the caller saves all sets at once with save_combined_results
+        self.per_set_files = per_set_files
+        
         # Setup Chrome options
         self.chrome_options = Options()
         self.chrome_options.add_argument('--headless')  # Run in headless mode
@@ -44,402 +354,750 @@ class EbayScraper:
         self.chrome_options.add_argument('--disable-dev-shm-usage')
         self.chrome_options.add_argument('--lang=de-DE')  # Set language to German
         
+        # Only the HTML is needed, so keep Chrome from starting subsystems we don't use
+        for arg in ('--disable-gpu',
+                    '--disable-software-rasterizer',
+                    '--disable-background-networking',
+                    '--disable-default-apps',
+                    '--disable-sync',
+                    '--disable-translate',
+                    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+                    '--disable-breakpad',
+                    '--no-first-run',
+                    '--no-default-browser-check',
+                    '--mute-audio',
+                    '--disk-cache-size=0',
+                    '--media-cache-size=0',
+                    '--window-size=1280,1696',
+                    '--blink-settings=imagesEnabled=false'):
+            self.chrome_options.add_argument(arg)
+        self.chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,  # Don't load images
+            'profile.managed_default_content_settings.stylesheets': 2,  # Don't load CSS
+            'profile.managed_default_content_settings.fonts': 2,  # Don't load web fonts
+        })
+        
         # Initialize the webdriver
         self.driver = None
-        print("Scraper initialized")
+        self.driver_path = None
+        self.driver_path_file = os.path.join(self.data_dir, '.driver_path')
+        self.driver_path_cached = False  # True if driver_path was read from driver_path_file
+        self.driver_on_ebay = False  # True once the browser has loaded an ebay.de page
+        self.prefetched_pages = {}  # url -> HTML fetched ahead of time by prefetch_pages
+        self.pending_pages = set()  # URLs the browser is fetching in the background, see start_prefetch
+        
+        # Paths of all saved result files, shared with the worker scrapers of fetch_many
+        self.saved_files = []
+        self.saved_files_lock = threading.Lock()
+        logger.info("Scraper initialized")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_driver_path(self, refresh=False):
+        """
+        Return the chromedriver path. The path is remembered on disk so that later
+        runs don't have to ask webdriver-manager (which checks online) again.
+        With refresh=True webdriver-manager is asked again, e.g. after a Chrome update.
+        """
+        if self.driver_path is None or refresh:
+            path = ''
+            if not refresh:
+                try:
+                    with open(self.driver_path_file) as f:
+                        path = f.read().strip()
+                except OSError:
+                    pass
+            self.driver_path_cached = bool(path) and os.path.exists(path)
+            if not self.driver_path_cached:
+                path = ChromeDriverManager().install()
+                with open(self.driver_path_file, 'w') as f:
+                    f.write(path)
+            self.driver_path = path
+        return self.driver_path
 
     def setup_driver(self):
         """Setup and return a Chrome webdriver instance."""
         if self.driver is None:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
+            try:
+                self.driver = self._start_driver(self.get_driver_path())
+            except WebDriverException as e:
+                if not self.driver_path_cached:
+                    raise
+                # The remembered chromedriver may not match Chrome any more
+                logger.warning("Starting Chrome failed (%s) - updating chromedriver", e)
+                self.driver = self._start_driver(self.get_driver_path(refresh=True))
+            self.driver.set_script_timeout(30)
+            # Block trackers and media that are still requested by page loads
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
         return self.driver
 
+    def _start_driver(self, driver_path):
+        """Start Chrome with the given chromedriver."""
+        return webdriver.Chrome(service=Service(driver_path), options=self.chrome_options)
+
     def close_driver(self):
         """Close the webdriver instance."""
         if self.driver:
             self.driver.quit()
             self.driver = None
+            self.driver_on_ebay = False
+            self.pending_pages.clear()
+
+    def _cache_path(self, url):
+        """Return the cache file path for a page URL."""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{key}.html')
+
+    def _read_cached_page(self, url):
+        """Return the cached HTML for a URL, or None if missing or expired."""
+        if not self.use_cache:
+            return None
+        path = self._cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _prune_cache(self):
+        """Delete expired pages from the cache directory."""
+        now = time.time()
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError as e:
+            logger.warning("Error reading page cache: %s", e)
+            return
+        removed = 0
+        for entry in entries:
+            if not entry.name.endswith('.html'):
+                continue
+            try:
+                if now - entry.stat().st_mtime > self.cache_ttl:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                continue  # Removed by another scraper in the meantime
+        if removed:
+            logger.debug("Removed %d expired pages from the cache", removed)
+
+    def _is_cached(self, url):
+        """Return True if the cache holds an unexpired copy of a URL."""
+        if not self.use_cache:
+            return False
+        try:
+            return time.time() - os.path.getmtime(self._cache_path(url)) <= self.cache_ttl
+        except OSError:
+            return False
+
+    def _write_cached_page(self, url, html):
+        """Store the HTML of a page in the cache."""
+        try:
+            with open(self._cache_path(url), 'w', encoding='utf-8') as f:
+                f.write(html)
+        except OSError as e:
+            logger.warning("Error writing page cache: %s", e)
+
+    def page_url(self, set_number, page):
+        """Return the URL of a sold-items search results page."""
+        return _SEARCH_URL.format(set_number=set_number, page=page)
+
+    def start_session(self):
+        """Open the browser on ebay.de without rendering a search results page."""
+        driver = self.setup_driver()
+        driver.get(_SESSION_URL)
+        self.driver_on_ebay = True
+        self.pending_pages.clear()  # Background fetches don't survive a navigation
+
+    def page_batch(self, set_number, first_page, last_page=None):
+        """
+        Return the URLs of the result pages to fetch together, starting at first_page
+        and stopping after last_page if the number of pages is known.
+        """
+        end = first_page + _PAGE_BATCH_SIZE
+        if last_page is not None:
+            end = min(end, last_page + 1)
+        return [self.page_url(set_number, p) for p in range(first_page, end)]
+
+    def page_available(self, url):
+        """Return True if a page can be read without waiting for a request."""
+        return url in self.prefetched_pages or self._is_cached(url)
+
+    def prefetch_pages(self, urls):
+        """
+        Fetch several result pages concurrently using the browser's fetch API.
+        Pages already started by start_prefetch are waited for instead of requested again.
+        """
+        urls = [url for url in urls if not self.page_available(url)]
+        if not urls:
+            return
+        if not self.driver_on_ebay:
+            self.start_session()
+        
+        logger.info("Prefetching %d pages", len(urls))
+        for url, html in zip(urls, self._fetch_in_browser(urls)):
+            if html is not None:
+                self.prefetched_pages[url] = html
+
+    def start_prefetch(self, urls):
+        """
+        Start fetching result pages in the browser without waiting for them, so they
+        download while the current page is parsed. prefetch_pages collects them.
+        """
+        urls = [url for url in urls if url not in self.pending_pages and not self.page_available(url)]
+        if not urls or not self.driver_on_ebay:
+            return
+        logger.debug("Starting background fetch of %d pages", len(urls))
+        try:
+            self.driver.execute_script(_START_FETCH_JS, urls, _FETCH_RETRIES, _RETRY_STATUSES)
+        except WebDriverException as e:
+            # Only a head start; prefetch_pages fetches the pages anyway
+            logger.debug("Error starting background fetch: %s", e)
+            return
+        self.pending_pages.update(urls)
+
+    def discard_prefetched_pages(self):
+        """Forget pages fetched ahead of time that were not used, in Python and in the browser."""
+        self.prefetched_pages.clear()
+        if self.pending_pages and self.driver is not None:
+            try:
+                self.driver.execute_script("window.__pendingPages = {};")
+            except WebDriverException as e:
+                logger.debug("Error discarding background fetches: %s", e)
+        self.pending_pages.clear()
+
+    def _polite_delay(self):
+        """Wait a short random time before a request if polite mode is on."""
+        if self.polite:
+            time.sleep(random.uniform(0.3, 0.8))
+
+    def _fetch_in_browser(self, urls):
+        """
+        Fetch pages with the browser's fetch API, keeping the session and cookies
+        without navigating. Returns the HTML per URL, None for failed requests.
+        """
+        self._polite_delay()
+        try:
+            pages = self.driver.execute_async_script(_FETCH_PAGES_JS, urls, _FETCH_RETRIES, _RETRY_STATUSES)
+        except WebDriverException as e:  # Includes the script timeout
+            logger.warning("Fetching %d pages in the browser failed: %s", len(urls), e)
+            pages = [None] * len(urls)
+        finally:
+            self.pending_pages.difference_update(urls)
+        results = []
+        for url, html in zip(urls, pages):
+            # Same check as the WebDriverWait in get_page_html
+            if html and 'srp-results' in html:
+                self._write_cached_page(url, html)
+                results.append(html)
+            else:
+                results.append(None)
+        return results
+
+    def get_page_html(self, url):
+        """Return the HTML of a search results page, or None if it has no results."""
+        html = self.prefetched_pages.pop(url, None)
+        if html is None:
+            html = self._read_cached_page(url)
+        if html is not None:
+            logger.debug("Using cached page")
+            return html
+        
+        # Fetch without a page navigation
+        if not self.driver_on_ebay:
+            self.start_session()
+        html = self._fetch_in_browser([url])[0]
+        if html is not None:
+            return html
+        logger.warning("Fetch failed - loading the page in the browser instead")
+        
+        # Load the page
+        driver = self.setup_driver()
+        self._polite_delay()
+        driver.get(url)
+        self.pending_pages.clear()
+        
+        # Wait for the search result items
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "ul.srp-results li.s-item"))
+            )
+        except TimeoutException:
+            return None
+        
+        self.driver_on_ebay = True
+        html = driver.page_source
+        self._write_cached_page(url, html)
+        return html
+
+    def item_info(self, item):
+        """
+        Return the s-item__info part of a result item, which holds all the fields we
+        read (the rest is the image section), or the whole item if it has none.
+        It is a child of the item's wrapper div, so only two levels are searched.
+        """
+        for wrapper in item:
+            for child in wrapper:
+                if 's-item__info' in (child.get('class') or '').split():  # Comments have no class
+                    return child
+        return item
+
+    def index_item(self, item):
+        """
+        Collect the elements we read fields from in a single pass over a result item.
+        Returns a dict keyed by (tag, class).
+        """
+        fields = {}
+        for element in item.iter(etree.Element):
+            name = element.tag
+            for cls in element.get('class', '').split():
+                key = (name, cls)
+                if key in _ITEM_FIELDS and key not in fields:
+                    fields[key] = element
+        return fields
+
+    def find_date_element(self, item, fields):
+        """Return the element holding the sold date of a result item, or None."""
+        date_elem = self.first_field(fields, _DATE_FIELDS)
+        if date_elem is not None:
+            return date_elem
+        # No dedicated date element, look for the "Verkauft"/"Beendet" text instead
+        matches = _SOLD_SPAN_XPATH(item) or _SOLD_DIV_XPATH(item)
+        if matches:
+            return matches[0]
+        return fields.get(('span', 'POSITIVE'))
+
+    def field_text(self, element):
+        """Return the text of an element found by index_item, or None if it is missing."""
+        return element.text_content() if element is not None else None
+
+    def first_field(self, fields, keys):
+        """Return the first element found for any of the (tag, class) keys, or None."""
+        for key in keys:
+            if key in fields:
+                return fields[key]
+        return None
 
     def is_valid_title(self, title, target_set):
         """
         Validate that the item title contains the correct LEGO set number.
         Only allows one number with the same digit length as the target set number.
         """
-        numbers = re.findall(r'\d+', title)
-        print(f"Title validation - Title: {title}")
-        print(f"Found numbers: {numbers}")
-        print(f"Target set: {target_set}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Title validation - Title: %s, target set: %s", title, target_set)
         
-        # Count how many numbers have the same length as target_set
-        target_length = len(target_set)
-        same_length_numbers = [num for num in numbers if len(num) == target_length]
+        # Most titles don't contain the set number at all
+        if target_set not in title:
+            if debug:
+                logger.debug("Set number not in title - rejecting")
+            return False
         
-        # If we have more than one number with the same length as target_set, check if all are the target
-        if len(same_length_numbers) > 1:
-            if all(num == target_set for num in same_length_numbers):
-                print(f"All numbers match the target set number: {same_length_numbers} - accepting")
-                return True
-            else:
-                print(f"Found multiple numbers with length {target_length} that do not match target: {same_length_numbers} - rejecting")
+        # Every number with the same length as target_set has to be the target itself,
+        # so stop at the first one that isn't
+        target_length = len(target_set)
+        found = False
+        for number in title.translate(_DIGIT_RUNS).split():
+            if len(number) != target_length:
+                continue
+            if number != target_set:
+                if debug:
+                    logger.debug("Found number %s with length %d that does not match target - rejecting",
+                                 number, target_length)
                 return False
-            
-        # If we have exactly one number with the same length, it must be our target
-        if len(same_length_numbers) == 1:
-            is_valid = same_length_numbers[0] == target_set
-            print(f"Found one number with matching length. Valid: {is_valid}")
-            return is_valid
-            
-        # If we have no numbers of the same length, reject
-        print("No numbers found with matching length - rejecting")
-        return False
+            found = True
+        
+        if debug:
+            logger.debug("Found matching set number: %s", found)
+        return found
 
     def parse_price(self, price_str):
         """Extract price value from string."""
         if not price_str:
-            return 0
-        print(f"Parsing price: {price_str}")
-        # Remove currency symbol and convert to float
-        price_str = price_str.replace('EUR', '').replace('€', '').strip()
-        price_str = price_str.replace(',', '.')
-        try:
-            price = float(re.search(r'\d+[.,]?\d*', price_str).group())
-            print(f"Extracted price: {price}")
-            return price
-        except (AttributeError, ValueError) as e:
-            print(f"Error parsing price: {e}")
-            return 0
+            return 0.0
+        return _parse_price_cached(price_str)
 
     def parse_date(self, date_str):
         """Parse date string to datetime object."""
         if not date_str:
             return None
-            
-        try:
-            print(f"Parsing date: {date_str}")
-            # Convert German month names to English
-            german_to_english = {
-                'Jan': 'Jan', 'Jän': 'Jan', 'Januar': 'January',
-                'Feb': 'Feb', 'Februar': 'February',
-                'Mär': 'Mar', 'März': 'March',
-                'Apr': 'Apr', 'April': 'April',
-                'Mai': 'May',
-                'Jun': 'Jun', 'Juni': 'June',
-                'Jul': 'Jul', 'Juli': 'July',
-                'Aug': 'Aug', 'August': 'August',
-                'Sep': 'Sep', 'September': 'September',
-                'Okt': 'Oct', 'Oktober': 'October',
-                'Nov': 'Nov', 'November': 'November',
-                'Dez': 'Dec', 'Dezember': 'December'
-            }
-            
-            # Remove common German text and clean up
-            date_str = (date_str.replace('Verkauft', '')
-                               .replace('Beendet:', '')
-                               .replace('am', '')
-                               .strip())
-            
-            # Replace German month names with English ones
-            for german, english in german_to_english.items():
-                date_str = date_str.replace(german, english)
-            
-            print(f"Cleaned date string: {date_str}")
-            date = parser.parse(date_str, fuzzy=True)
-            print(f"Parsed date: {date}")
-            return date.strftime('%Y-%m-%d')  # Return formatted date string
-        except Exception as e:
-            print(f"Error parsing date: {e}")
-            return None
+        return _parse_date_cached(date_str)
 
-    def is_within_30_days(self, date_str):
-        """Check if the given date is within the last 30 days."""
-        if not date_str:
-            return True  # Accept items without dates for now
-            
-        print(f"Checking if date is within 30 days: {date_str}")
-        date = parser.parse(self.parse_date(date_str) or '', fuzzy=True)
-        if not date:
-            return True  # Accept items with unparseable dates for now
-            
-        days_diff = (datetime.now() - date).days
-        print(f"Days difference: {days_diff}")
-        return days_diff <= 30
+    def get_cutoff_date(self):
+        """Return the oldest sold date that counts as within the last 30 days."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - timedelta(days=30)
+
+    def is_within_30_days(self, date, cutoff):
+        """
+        Check if the given date (as returned by parse_date) is within the last 30 days,
+        using the cutoff from get_cutoff_date.
+        """
+        if date is None:
+            return True  # Accept items without or with unparseable dates for now
+        return date >= cutoff
 
-    def save_results_to_csv(self, df, set_number):
-        """Save results to CSV with specific naming format."""
+    def save_results(self, df, set_number, csv_source=None):
+        """
+        Save results in the configured output format with specific naming format.
+        csv_source may name a CSV file that already holds exactly df's rows in order;
+        for CSV output it is moved into place instead of writing df again.
+        """
         if df is None or df.empty:
             return None
             
-        # Get the date range from the data
-        df['End Time'] = pd.to_datetime(df['End Time'])
-        start_date = df['End Time'].min().strftime('%Y%m%d')
-        end_date = df['End Time'].max().strftime('%Y%m%d')
-        current_time = datetime.now().strftime('%H%M%S')
+        # Get the date range from the data ('End Time' is already datetime);
+        # fall back to today if no item had a readable date
+        end_times = df['End Time'].dropna()
+        today = datetime.now()
+        start_date = (end_times.min() if not end_times.empty else today).strftime('%Y%m%d')
+        end_date = (end_times.max() if not end_times.empty else today).strftime('%Y%m%d')
+        current_time = today.strftime('%H%M%S')
         
         # Create filename with the specified format
-        filename = f'Ebay_Lego_{set_number}_{start_date}_{end_date}_{current_time}.csv'
+        filename = f'Ebay_Lego_{set_number}_{start_date}_{end_date}_{current_time}.{self.output_format}'
         filepath = os.path.join(self.data_dir, filename)
         
-        print(f"\nSaving results for set {set_number} to {filepath}")
-        df.to_csv(filepath, index=False)
+        logger.info("Saving results for set %s to %s", set_number, filepath)
+        if self.output_format == 'parquet':
+            df.to_parquet(filepath, compression='zstd', index=False)
+        elif self.output_format == 'feather':
+            df.reset_index(drop=True).to_feather(filepath)
+        elif csv_source:
+            os.replace(csv_source, filepath)
+        else:
+            df.to_csv(filepath, index=False)
+        with self.saved_files_lock:
+            self.saved_files.append(filepath)
         return filepath
 
-    def fetch_ebay_sold_items(self, set_number):
-        """Fetch sold items for a given LEGO set number from eBay Germany."""
-        driver = self.setup_driver()
-        results = []  # List to store results
-        
-        print(f"\n{'='*80}")
-        print(f"Searching for LEGO set {set_number}...")
-        print(f"{'='*80}")
+    def save_combined_results(self, all_results):
+        """Save the results of several sets (as returned by fetch_many) to a single file."""
+        frames = [df for df in all_results.values() if df is not None and not df.empty]
+        if not frames:
+            return None
+        return self.save_results(pd.concat(frames, ignore_index=True), 'combined')
+
+    def fetch_ebay_sold_items(self, set_number, cutoff=None):
+        """
+        Fetch sold items for a given LEGO set number from eBay Germany.
+        cutoff is the oldest sold date to keep (default: from get_cutoff_date).
+        """
+        logger.info('=' * 80)
+        logger.info("Searching for LEGO set %s...", set_number)
+        logger.info('=' * 80)
         
         page = 1
+        if cutoff is None:
+            cutoff = self.get_cutoff_date()
         has_next_page = True
         reached_old_items = False
+        last_page = None  # Estimated from the result count on page 1
         
-        while has_next_page and not reached_old_items:
-            url = f'https://www.ebay.de/sch/i.html?_nkw=LEGO+{set_number}&_sop=12&LH_Complete=1&LH_Sold=1&_pgn={page}'
-            print(f"\nFetching page {page} - URL: {url}")
+        # Stream rows to a partial CSV file while scraping
+        partial_path = os.path.join(self.data_dir, f'Ebay_Lego_{set_number}.csv.part')
+        items_written = 0
+        # Rows usually arrive newest first already; only sort if one doesn't
+        last_end_time = None
+        missing_end_time = False
+        needs_sort = False
+        with open(partial_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=_RESULT_COLUMNS)
+            writer.writeheader()
+            
+            while has_next_page and not reached_old_items:
+                url = self.page_url(set_number, page)
+                logger.info("Fetching page %d - URL: %s", page, url)
             
-            try:
-                # Load the page
-                driver.get(url)
-                time.sleep(2)  # Wait for page to load
-                
-                # Wait for search results
                 try:
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "ul.srp-results"))
-                    )
-                except TimeoutException:
-                    print("No more results found")
-                    break
+                    # Fetch this page and the following ones at once; pages past the
+                    # last one or past the 30 day cutoff are simply not used. Page 1 is
+                    # fetched on its own since most sets have a single page of results.
+                    if page > 1 and not self.page_available(url):
+                        self.prefetch_pages(self.page_batch(set_number, page, last_page))
+                    
+                    html = self.get_page_html(url)
+                    if html is None:
+                        logger.info("No more results found")
+                        break
                 
-                # Parse the page
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
-                items = soup.select('li.s-item')
+                    # Parse the page
+                    tree = lxml.html.fromstring(_results_fragment(html))
+                    items = _ITEMS_XPATH(tree)
                 
-                if not items:
-                    print("No items found on this page")
-                    break
+                    if not items:
+                        logger.info("No items found on this page")
+                        break
                 
-                print(f"\nFound {len(items)} items on page {page}")
+                    logger.info("Found %d items on page %d", len(items), page)
                 
-                # Check if there's a next page
-                next_page = soup.select_one('a.pagination__next')
-                has_next_page = next_page is not None
+                    # Check if there's a next page
+                    has_next_page = len(items) >= _MIN_FULL_PAGE_ITEMS and _NEXT_PAGE_RE.search(html) is not None
+                    if page == 1 and has_next_page:
+                        # Don't fetch batches of pages past the last one
+                        last_page = _estimate_last_page(html, len(items))
+                        logger.debug("Estimated number of pages: %s", last_page)
                 
-                old_items_count = 0  # Counter for items older than 30 days
-                valid_items_on_page = 0  # Counter for valid items on this page
+                    old_items_count = 0  # Counter for items older than 30 days
+                    valid_items_on_page = 0  # Counter for valid items on this page
                 
-                for idx, item in enumerate(items, 1):
-                    try:
-                        print(f"\nProcessing item {idx}/{len(items)} on page {page}")
+                    for idx, item in enumerate(items, 1):
+                        try:
+                            logger.debug("Processing item %d/%d on page %d", idx, len(items), page)
                         
-                        # Extract title
-                        title_elem = item.select_one('div.s-item__title')
-                        if not title_elem:
-                            print("No title element found")
-                            continue
-                        title = title_elem.text.strip()
-                        print(f"Title: {title}")
+                            info = self.item_info(item)
+                            fields = self.index_item(info)
+                            
+                            # Extract title
+                            title = self.field_text(fields.get(('div', 's-item__title')))
+                            if title is None:
+                                logger.debug("No title element found")
+                                continue
+                            title = title.strip()
+                            logger.debug("Title: %s", title)
                         
-                        # Skip the first item on page 1 (it's usually "Shop on eBay")
-                        if page == 1 and idx == 1 and title == "Shop on eBay":
-                            print("Skipping 'Shop on eBay' item")
-                            continue
+                            # Skip the first item on page 1 (it's usually "Shop on eBay")
+                            if page == 1 and idx == 1 and title == "Shop on eBay":
+                                logger.debug("Skipping 'Shop on eBay' item")
+                                continue
                         
-                        # Validate title
-                        if not self.is_valid_title(title, set_number):
-                            print("Invalid title - skipping")
-                            continue
-                            
-                        # Extract sold date first to check if we should continue
-                        date_elem = (
-                            item.find('span', string=re.compile(r'Verkauft|Beendet')) or
-                            item.find('div', string=re.compile(r'Verkauft|Beendet')) or
-                            item.select_one('span.s-item__endedDate') or
-                            item.select_one('div.s-item__ended-date') or
-                            item.select_one('span.POSITIVE')
-                        )
-                        sold_date = date_elem.text if date_elem else None
-                        print(f"Found date element: {sold_date}")
+                            # Extract sold date first to check if we should continue
+                            sold_date = self.field_text(self.find_date_element(info, fields))
+                            logger.debug("Found date element: %s", sold_date)
                         
-                        # Parse the date
-                        parsed_date = self.parse_date(sold_date)
+                            # Parse the date
+                            parsed_date = self.parse_date(sold_date)
                         
-                        # Check if item is within 30 days
-                        if not self.is_within_30_days(sold_date):
-                            print("Item not sold within last 30 days - skipping")
-                            old_items_count += 1
-                            # If we've found multiple old items, assume we've reached the cutoff
-                            if old_items_count >= 3 and valid_items_on_page > 0:
-                                print("\nFound multiple items older than 30 days - stopping pagination")
-                                reached_old_items = True
-                                break
-                            continue
+                            # Check if item is within 30 days
+                            if not self.is_within_30_days(parsed_date, cutoff):
+                                logger.debug("Item not sold within last 30 days - skipping")
+                                # Results are not sorted by date, so only old items of
+                                # this set count towards stopping
+                                if not self.is_valid_title(title, set_number):
+                                    continue
+                                old_items_count += 1
+                                # If we've found multiple old items, assume we've reached the cutoff
+                                if old_items_count >= 3 and valid_items_on_page > 0:
+                                    logger.info("Found multiple items older than 30 days - stopping pagination")
+                                    reached_old_items = True
+                                    break
+                                continue
                             
-                        valid_items_on_page += 1
+                            # Validate title
+                            if not self.is_valid_title(title, set_number):
+                                logger.debug("Invalid title - skipping")
+                                continue
                             
-                        # Extract price
-                        price_elem = item.select_one('span.s-item__price')
-                        print(f"Price element: {price_elem.text if price_elem else None}")
-                        item_price = self.parse_price(price_elem.text if price_elem else None)
+                            valid_items_on_page += 1
+                            
+                            # Extract price
+                            price_text = self.field_text(fields.get(('span', 's-item__price')))
+                            logger.debug("Price element: %s", price_text)
+                            item_price = self.parse_price(price_text)
                         
-                        # Extract shipping cost
-                        shipping_elem = item.select_one('span.s-item__shipping')
-                        print(f"Shipping element: {shipping_elem.text if shipping_elem else None}")
-                        shipping_cost = self.parse_price(shipping_elem.text if shipping_elem else None)
+                            # Extract shipping cost
+                            shipping_text = self.field_text(fields.get(('span', 's-item__shipping')))
+                            logger.debug("Shipping element: %s", shipping_text)
+                            shipping_cost = self.parse_price(shipping_text)
                         
-                        # Extract URL
-                        url_elem = item.select_one('a.s-item__link')
-                        item_url = url_elem['href'] if url_elem else None
+                            # Extract URL
+                            url_elem = fields.get(('a', 's-item__link'))
+                            item_url = url_elem.get('href') if url_elem is not None else None
                         
-                        # Extract location
-                        location_elem = item.select_one('span.s-item__location') or item.select_one('span.s-item__itemLocation')
-                        location = location_elem.text if location_elem else 'Deutschland'
-                        if location.startswith('aus '):
-                            location = location[4:]  # Remove 'aus ' prefix
-                        print(f"Location: {location}")
+                            # Extract location
+                            location = self.field_text(self.first_field(fields, _LOCATION_FIELDS)) or 'Deutschland'
+                            if location.startswith('aus '):
+                                location = location[4:]  # Remove 'aus ' prefix
+                            logger.debug("Location: %s", location)
                         
-                        # Extract item condition
-                        condition_elem = item.select_one('span.SECONDARY_INFO')
-                        condition = condition_elem.text.strip() if condition_elem else 'Unknown'
-                        print(f"Condition: {condition}")
+                            # Extract item condition
+                            condition_text = self.field_text(fields.get(('span', 'SECONDARY_INFO')))
+                            condition = condition_text.strip() if condition_text is not None else 'Unknown'
+                            logger.debug("Condition: %s", condition)
                         
-                        # Extract seller type
-                        seller_elem = item.select_one('div.s-item__subtitle')
-                        if seller_elem:
-                            seller_text = seller_elem.text
-                            if 'Gewerblich' in seller_text:
-                                seller_type = 'Gewerblich'
-                            elif 'Privat' in seller_text:
-                                seller_type = 'Privat'
+                            # Extract seller type
+                            seller_text = self.field_text(fields.get(('div', 's-item__subtitle')))
+                            if seller_text is not None:
+                                if 'Gewerblich' in seller_text:
+                                    seller_type = 'Gewerblich'
+                                elif 'Privat' in seller_text:
+                                    seller_type = 'Privat'
+                                else:
+                                    seller_type = 'Unknown'
                             else:
                                 seller_type = 'Unknown'
-                        else:
-                            seller_type = 'Unknown'
-                        print(f"Seller Type: {seller_type}")
+                            logger.debug("Seller Type: %s", seller_type)
                         
-                        # Calculate total price
-                        total_price = round(item_price + shipping_cost, 2)
+                            # Calculate total price
+                            total_price = round(item_price + shipping_cost, 2)
                         
-                        result = {
-                            'Title': title,
-                            'Item Price': item_price,
-                            'Shipping Fee': shipping_cost,
-                            'Total Price': total_price,
-                            'End Time': parsed_date,
-                            'Currency': 'EUR',
-                            'Location': location,
-                            'URL': item_url,
-                            'Set Number': set_number,
-                            'Condition': condition,
-                            'Seller Type': seller_type
-                        }
+                            result = {
+                                'Title': title,
+                                'Item Price': item_price,
+                                'Shipping Fee': shipping_cost,
+                                'Total Price': total_price,
+                                'End Time': _format_date(parsed_date),
+                                'Currency': 'EUR',
+                                'Location': location,
+                                'URL': item_url,
+                                'Set Number': set_number,
+                                'Condition': condition,
+                                'Seller Type': seller_type
+                            }
                         
-                        results.append(result)
-                        print(f"Successfully added item to results")
+                            writer.writerow(result)
+                            items_written += 1
+                            end_time = result['End Time']
+                            if end_time is None:
+                                missing_end_time = True
+                            else:
+                                if missing_end_time or (last_end_time and end_time > last_end_time):
+                                    needs_sort = True
+                                last_end_time = end_time
+                            logger.debug("Successfully added item to results")
                         
-                    except Exception as e:
-                        print(f"Error processing item: {str(e)}")
-                        continue
+                        except Exception as e:
+                            logger.warning("Error processing item: %s", e)
+                            continue
                 
-                if reached_old_items:
-                    print(f"\nStopping pagination as we've reached items older than 30 days")
-                    break
+                    if reached_old_items:
+                        logger.info("Stopping pagination as we've reached items older than 30 days")
+                        break
                     
-                if has_next_page and not reached_old_items:
-                    print(f"\nMoving to page {page + 1}")
-                    page += 1
-                    time.sleep(2)
-                else:
-                    print("\nNo more pages available")
+                    if has_next_page and not reached_old_items:
+                        logger.info("Moving to page %d", page + 1)
+                        page += 1
+                        # When the last page of a prefetched batch is next, start downloading
+                        # the following batch while that page is parsed
+                        next_batch = page + 1
+                        if (self.page_available(self.page_url(set_number, page))
+                                and not self.page_available(self.page_url(set_number, next_batch))):
+                            self.start_prefetch(self.page_batch(set_number, next_batch, last_page))
+                    else:
+                        logger.info("No more pages available")
                     
-            except Exception as e:
-                print(f"Error fetching page {page} for set {set_number}: {str(e)}")
-                break
-
-        # Process results for current set number
-        if results:
-            # Create DataFrame for current set
-            df = pd.DataFrame(results)
-            
-            # Sort by date
-            df['End Time'] = pd.to_datetime(df['End Time'])
-            df = df.sort_values('End Time', ascending=False)
-            
-            # Reorder columns
-            df = df[['Title', 'Item Price', 'Shipping Fee', 'Total Price', 'End Time', 'Condition', 'Seller Type', 'Currency', 'Location', 'URL', 'Set Number']]
-            
-            # Ensure 'Seller Type' column is present
-            if 'Seller Type' not in df.columns:
-                df['Seller Type'] = 'Unknown'
-            
-            # Save to CSV
-            filepath = self.save_results_to_csv(df, set_number)
-            if filepath:
-                return df
-            
-            # Store in all_results dictionary
-            all_results[set_number] = df
-            
-            # Print results for current set
-            print(f"\nFound {len(df)} items for set {set_number}")
-            print("\nResults for set {set_number}:")
-            with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.width', None):
-                print(df[['Title', 'Item Price', 'Shipping Fee', 'Total Price', 'End Time', 'Condition', 'Seller Type', 'Currency', 'Location', 'URL']])
-        else:
-            print(f"\nNo results found for set {set_number}")
+                except Exception as e:
+                    logger.error("Error fetching page %d for set %s: %s", page, set_number, e)
+                    break
 
-        # Close the browser
-        self.close_driver()
+        # Pages prefetched past the last one or the cutoff are not needed any more
+        self.discard_prefetched_pages()
+        
+        # Sort the written rows by date if needed and save the final file
+        if items_written:
+            df = pd.read_csv(partial_path, dtype=_RESULT_DTYPES)
+            df['End Time'] = pd.to_datetime(df['End Time'], format='%Y-%m-%d')
+            if needs_sort:
+                df = df.sort_values('End Time', ascending=False)
+            if self.per_set_files:
+                self.save_results(df, set_number, csv_source=None if needs_sort else partial_path)
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            logger.info("Found %d items for set %s", len(df), set_number)
+            return df
+        
+        os.remove(partial_path)
+        logger.info("No results found for set %s", set_number)
+        return None
 
-        if not all_results:
-            print("\nNo results found for any set!")
-            return None, None
+    def _fetch_set_safely(self, set_number, cutoff):
+        """Run fetch_ebay_sold_items, returning None instead of raising so other sets still run."""
+        try:
+            return self.fetch_ebay_sold_items(set_number, cutoff)
+        except Exception as e:
+            logger.error("Error processing set %s: %s", set_number, e)
+            return None
 
-        print("\nAll files saved:")
-        for filepath in saved_files:
-            print(filepath)
+    def fetch_many(self, set_numbers, max_workers=4):
+        """
+        Fetch sold items for several LEGO set numbers, scraping up to max_workers
+        sets in parallel with one browser each.
+        Returns a dict of set number -> DataFrame (None for sets without results).
+        """
+        set_numbers = list(dict.fromkeys(set_numbers))  # Scrape each set only once
+        if not set_numbers:
+            return {}
+        cutoff = self.get_cutoff_date()  # The same cutoff for all sets of a run
+        workers = min(max_workers, len(set_numbers))
+        if workers <= 1:
+            return {set_number: self._fetch_set_safely(set_number, cutoff) for set_number in set_numbers}
+        
+        # One scraper (and browser) per worker, this one included. The driver path is
+        # resolved up front so the workers don't all run webdriver-manager at once.
+        driver_path = self.get_driver_path()
+        extra_scrapers = []
+        for _ in range(workers - 1):
+            scraper = EbayScraper(use_cache=self.use_cache, cache_ttl=self.cache_ttl, polite=self.polite,
+                                  output_format=self.output_format, per_set_files=self.per_set_files)
+            scraper.driver_path = driver_path
+            scraper.driver_path_cached = self.driver_path_cached
+            scraper.saved_files = self.saved_files
+            scraper.saved_files_lock = self.saved_files_lock
+            extra_scrapers.append(scraper)
         
-        return all_results, saved_files
+        scrapers = queue.Queue()
+        for scraper in [self] + extra_scrapers:
+            scrapers.put(scraper)
+        
+        def scrape_one_set(set_number):
+            scraper = scrapers.get()
+            try:
+                return scraper._fetch_set_safely(set_number, cutoff)
+            finally:
+                scrapers.put(scraper)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return dict(zip(set_numbers, executor.map(scrape_one_set, set_numbers)))
+        finally:
+            for scraper in extra_scrapers:
+                scraper.close()
 
     def close(self):
         """Close the WebDriver when done."""
         try:
             if hasattr(self, 'driver') and self.driver:
-                self.driver.quit()
-                print("WebDriver closed successfully")
+                self.close_driver()
+                logger.info("WebDriver closed successfully")
         except Exception as e:
-            print(f"Error closing WebDriver: {e}")
+            logger.error("Error closing WebDriver: %s", e)
 
 def main():
     """Main function to run the eBay scraper"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("\nStarting eBay LEGO Price Scraper...")
-    scraper = EbayScraper()
+    set_numbers = input("\nEnter the LEGO set numbers separated by commas (e.g., 40632, 75257): ").split(',')
+    set_numbers = [num.strip() for num in set_numbers if num.strip().isdigit()]
+    
+    # Check the input before setting up the scraper
+    if not set_numbers:
+        print("\nError running scraper: No valid set numbers provided")
+        return
     
+    scraper = EbayScraper()
     try:
-        set_numbers = input("\nEnter the LEGO set numbers separated by commas (e.g., 40632, 75257): ").split(',')
-        set_numbers = [num.strip() for num in set_numbers if num.strip().isdigit()]
-        
-        if not set_numbers:
-            raise ValueError("No valid set numbers provided")
-            
         print(f"\nProcessing LEGO sets: {', '.join(set_numbers)}")
-        results, saved_files = scraper.fetch_ebay_sold_items(set_numbers)
+        scraper.fetch_many(set_numbers)
         
-        if results is not None:
+        if scraper.saved_files:
             print("\nScraping completed successfully!")
             print("\nFiles saved:")
-            for filepath in saved_files:
+            for filepath in scraper.saved_files:
                 print(filepath)
+        else:
+            print("\nNo results found for any set!")
             
     except Exception as e:
         print(f"\nError running scraper: {str(e)}")
     finally:
         # Ensure browser is closed
-        scraper.close_driver()
+        scraper.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file